@@ -1,15 +1,86 @@
 from __future__ import annotations
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+import re
+from dataclasses import dataclass, fields
+from pathlib import Path
 
+_ENV_PREFIX = "LLM_SHELL_"
+_ENV_FILE = ".env"
+# A comment after an unquoted value needs whitespace before the "#".
+_INLINE_COMMENT = re.compile(r"\s+#")
 
-class Settings(BaseSettings):
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     host: str = "0.0.0.0"
     port: int = 8776
     log_dir: str = "logs"
     default_restart_timeout: int = 10
+    access_log: bool = True
+
+
+def _read_env_file(path: str) -> dict[str, str]:
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+
+    values: dict[str, str] = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip().removeprefix("export ").strip()
+        values[key] = _parse_env_value(value)
+    return values
+
+
+def _parse_env_value(value: str) -> str:
+    # Follows python-dotenv: a quoted value is the text between its matching
+    # quotes, an unquoted one ends at an inline comment.
+    value = value.strip()
+    if value[:1] in ("'", '"'):
+        end = value.find(value[0], 1)
+        if end != -1:
+            return value[1:end]
+    return _INLINE_COMMENT.split(value, 1)[0].strip()
+
+
+def _parse_int(name: str, value: str) -> int:
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise ValueError(f"{_ENV_PREFIX}{name.upper()} must be an integer, got {value!r}") from exc
+
+
+def _parse_bool(name: str, value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"{_ENV_PREFIX}{name.upper()} must be a boolean, got {value!r}")
+
+
+def load_settings() -> Settings:
+    # Environment variables take precedence over the .env file; names are case-insensitive.
+    env = {key.upper(): value for key, value in _read_env_file(_ENV_FILE).items()}
+    env.update((key.upper(), value) for key, value in os.environ.items())
 
-    model_config = SettingsConfigDict(env_prefix="LLM_SHELL_", env_file=".env")
+    values: dict[str, object] = {}
+    for field in fields(Settings):
+        raw = env.get(f"{_ENV_PREFIX}{field.name.upper()}")
+        if raw is None:
+            continue
+        if isinstance(field.default, bool):
+            values[field.name] = _parse_bool(field.name, raw)
+        elif isinstance(field.default, int):
+            values[field.name] = _parse_int(field.name, raw)
+        else:
+            values[field.name] = raw
+    return Settings(**values)
 
 
-settings = Settings()
+settings = load_settings()
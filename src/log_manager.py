@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-import json
+import bisect
+import os
+import re
+import selectors
 import sys
 import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+import orjson
 
 from .exceptions import BadRequestError, NotFoundError
 
+_READ_SIZE = 64 * 1024
+_BATCH_BYTES = 64 * 1024
+_BATCH_INTERVAL = 0.05
+_IDLE_INTERVAL = 0.25
+# An unterminated line longer than this is written out as it stands.
+_MAX_LINE_BYTES = 64 * 1024
+# Universal newlines, as the text-mode pipe split them: \r\n, \r or \n.
+_NEWLINE = re.compile(rb"\r\n|\r|\n")
+
 
 class LogManager:
     def __init__(self, log_dir: str = "logs") -> None:
@@ -16,7 +31,7 @@ class LogManager:
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._writer_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._write_lock = threading.Lock()
+        self._line_counts: dict[str, int] = {}
 
     def create_log_file(self) -> str:
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S-%f")
@@ -47,35 +62,21 @@ class LogManager:
         lines: Optional[int] = None,
         seconds: Optional[int] = None,
     ) -> dict:
-        if lines is not None and seconds is not None:
-            raise BadRequestError("Cannot specify both 'lines' and 'seconds'")
-
-        file_path = Path(log_file)
-        if not file_path.exists():
-            raise NotFoundError(f"Log file not found: {log_file}")
+        file_path = self._resolve_log_file(log_file, lines, seconds)
 
-        entries = []
-        with file_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                try:
-                    entry = json.loads(line.strip())
-                    entries.append(entry)
-                except json.JSONDecodeError:
-                    continue
-
-        total_lines = len(entries)
-
-        if seconds is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(seconds=seconds)
-            filtered = [
-                entry
-                for entry in entries
-                if self._parse_timestamp(entry["timestamp"]) >= cutoff
-            ]
-        elif lines is not None:
-            filtered = entries[-lines:] if lines > 0 else entries
+        if seconds is None and lines is not None and lines > 0:
+            filtered = self._decode_entries(self._tail(file_path, lines))[-lines:]
+            total_lines = self._line_counts.get(log_file)
+            if total_lines is None:
+                total_lines = self._count_lines(file_path)
         else:
-            filtered = entries
+            entries = self._decode_entries(file_path.read_bytes())
+            total_lines = len(entries)
+            if seconds is not None:
+                cutoff = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+                filtered = entries[self._cutoff_index(entries, cutoff):]
+            else:
+                filtered = entries
 
         content = "\n".join(entry.get("line", "") for entry in filtered)
 
@@ -86,6 +87,139 @@ class LogManager:
             "content": content,
         }
 
+    def tail_lines(self, log_file: str, lines: int) -> list[str]:
+        # The last lines as a list, for callers that would split the joined
+        # content straight back into lines.
+        file_path = self._resolve_log_file(log_file, lines, None)
+        entries = self._decode_entries(self._tail(file_path, lines))[-lines:]
+        return [entry.get("line", "") for entry in entries]
+
+    def iter_logs(
+        self,
+        log_file: str,
+        lines: Optional[int] = None,
+        seconds: Optional[int] = None,
+    ) -> Iterator[str]:
+        # Same content as read_logs()["content"], produced in chunks so large
+        # logs are never held in memory as one string. Arguments are validated
+        # here, before the caller starts consuming the stream.
+        file_path = self._resolve_log_file(log_file, lines, seconds)
+
+        if seconds is None and lines is not None and lines > 0:
+            entries = self._decode_entries(self._tail(file_path, lines))[-lines:]
+            return iter(["\n".join(entry.get("line", "") for entry in entries)])
+
+        cutoff = None
+        if seconds is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+        return self._stream_content(file_path, cutoff)
+
+    @staticmethod
+    def etag(log_file: str, lines: Optional[int] = None) -> str:
+        # The writer only appends, so inode, size and mtime identify the
+        # content; lines is part of the tag because it selects a different tail.
+        try:
+            stat = os.stat(log_file)
+        except FileNotFoundError as exc:
+            raise NotFoundError(f"Log file not found: {log_file}") from exc
+        return f'"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}-{lines or 0}"'
+
+    @staticmethod
+    def _resolve_log_file(log_file: str, lines: Optional[int], seconds: Optional[int]) -> Path:
+        if lines is not None and seconds is not None:
+            raise BadRequestError("Cannot specify both 'lines' and 'seconds'")
+
+        file_path = Path(log_file)
+        if not file_path.exists():
+            raise NotFoundError(f"Log file not found: {log_file}")
+        return file_path
+
+    @classmethod
+    def _stream_content(cls, file_path: Path, cutoff: Optional[datetime]) -> Iterator[str]:
+        separator = ""
+        partial = b""
+        with file_path.open("rb") as handle:
+            while True:
+                block = handle.read(_READ_SIZE)
+                data = partial + block
+                if block:
+                    # Keep the trailing incomplete line for the next block.
+                    end = data.rfind(b"\n") + 1
+                    partial = data[end:]
+                    data = data[:end]
+                entries = cls._decode_entries(data)
+                if cutoff is not None and entries:
+                    entries = entries[cls._cutoff_index(entries, cutoff):]
+                    if entries:
+                        cutoff = None  # Entries are ordered; the rest are all newer.
+                if entries:
+                    yield separator + "\n".join(entry.get("line", "") for entry in entries)
+                    separator = "\n"
+                if not block:
+                    return
+
+    @staticmethod
+    def _tail(file_path: Path, lines: int) -> bytes:
+        with file_path.open("rb") as handle:
+            handle.seek(0, os.SEEK_END)
+            position = handle.tell()
+            blocks: list[bytes] = []
+            newlines = 0
+            while position > 0 and newlines <= lines:
+                size = min(_READ_SIZE, position)
+                position -= size
+                handle.seek(position)
+                block = handle.read(size)
+                newlines += block.count(b"\n")
+                blocks.append(block)
+        data = b"".join(reversed(blocks))
+        if position > 0:
+            # Drop the leading partial line cut by the block boundary.
+            data = data[data.find(b"\n") + 1:]
+        return data
+
+    @staticmethod
+    def _count_lines(file_path: Path) -> int:
+        count = 0
+        with file_path.open("rb") as handle:
+            for block in iter(lambda: handle.read(_READ_SIZE), b""):
+                count += block.count(b"\n")
+        return count
+
+    @staticmethod
+    def _decode_entries(raw: bytes) -> list:
+        lines = [line for line in raw.split(b"\n") if line.strip()]
+        if not lines:
+            return []
+        try:
+            return orjson.loads(b"[" + b",".join(lines) + b"]")
+        except orjson.JSONDecodeError:
+            pass
+
+        # Slow path: a partially written or corrupt line, decode one by one.
+        entries = []
+        for line in lines:
+            try:
+                entries.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                continue
+        return entries
+
+    @classmethod
+    def _cutoff_index(cls, entries: list, cutoff: datetime) -> int:
+        # Entries are appended in order and their UTC ISO-8601 timestamps sort
+        # lexicographically, so bisect on the seconds prefix and only parse the
+        # entries that fall into the boundary second.
+        cutoff_prefix = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
+        index = bisect.bisect_left(entries, cutoff_prefix, key=lambda entry: entry["timestamp"][:19])
+        while (
+            index < len(entries)
+            and entries[index]["timestamp"][:19] == cutoff_prefix
+            and cls._parse_timestamp(entries[index]["timestamp"]) < cutoff
+        ):
+            index += 1
+        return index
+
     @staticmethod
     def _parse_timestamp(raw: str) -> datetime:
         normalized = raw.replace("Z", "+00:00")
@@ -96,20 +230,109 @@ class LogManager:
 
     def _log_writer(self, process, log_file: str) -> None:
         try:
-            with open(log_file, "a", encoding="utf-8") as handle:
-                while not self._stop_event.is_set():
-                    line = process.stdout.readline()
-                    if not line:
-                        if process.poll() is not None:
-                            break
-                        continue
-
-                    log_entry = {
-                        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-                        "line": line.rstrip("\n\r"),
-                    }
-                    with self._write_lock:
-                        handle.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-                        handle.flush()
+            source = process.stdout.fileno()
+            target = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except Exception as exc:
+            print(f"Error writing log: {exc}", file=sys.stderr)
+            return
+        # A selector rather than select.select(), which rejects fds >= 1024.
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(source, selectors.EVENT_READ)
+        except Exception as exc:
+            print(f"Error writing log: {exc}", file=sys.stderr)
+            selector.close()
+            os.close(target)
+            return
+
+        pending = bytearray()
+        pending_lines = 0
+        partial = b""
+        # The previous chunk ended in \r, so a leading \n completes that \r\n.
+        skip_lf = False
+        batch_started = 0.0
+        drain_until: Optional[float] = None
+        try:
+            while True:
+                now = time.monotonic()
+                if drain_until is None and self._stop_event.is_set():
+                    drain_until = now + _BATCH_INTERVAL
+                if drain_until is not None:
+                    if now >= drain_until:
+                        break
+                    timeout = 0.0
+                elif pending:
+                    timeout = max(0.0, batch_started + _BATCH_INTERVAL - now)
+                else:
+                    timeout = _IDLE_INTERVAL
+
+                if selector.select(timeout):
+                    chunk = os.read(source, _READ_SIZE)
+                    if not chunk:
+                        break
+                    if skip_lf and chunk.startswith(b"\n"):
+                        chunk = chunk[1:]
+                    skip_lf = chunk.endswith(b"\r")
+                    lines = _NEWLINE.split(partial + chunk)
+                    partial = lines.pop()
+                    if len(partial) >= _MAX_LINE_BYTES:
+                        lines.append(partial)
+                        partial = b""
+                    if lines:
+                        if not pending:
+                            batch_started = now
+                        timestamp = self._timestamp()
+                        for raw in lines:
+                            pending += self._encode_entry(timestamp, raw)
+                        pending_lines += len(lines)
+                elif drain_until is not None:
+                    break
+
+                if pending and (
+                    len(pending) >= _BATCH_BYTES
+                    or time.monotonic() - batch_started >= _BATCH_INTERVAL
+                ):
+                    self._write_batch(target, pending)
+                    self._add_line_count(log_file, pending_lines)
+                    pending_lines = 0
         except Exception as exc:
             print(f"Error writing log: {exc}", file=sys.stderr)
+        finally:
+            try:
+                if partial:
+                    pending += self._encode_entry(self._timestamp(), partial)
+                    pending_lines += 1
+                if pending:
+                    self._write_batch(target, pending)
+                    self._add_line_count(log_file, pending_lines)
+            except Exception as exc:
+                print(f"Error writing log: {exc}", file=sys.stderr)
+            finally:
+                selector.close()
+                os.close(target)
+
+    def _add_line_count(self, log_file: str, lines: int) -> None:
+        # Only the writer thread updates a given key; readers see whole ints.
+        self._line_counts[log_file] = self._line_counts.get(log_file, 0) + lines
+
+    @staticmethod
+    def _write_batch(fd: int, pending: bytearray) -> None:
+        # The writer thread owns the descriptor exclusively, so no lock is needed.
+        view = memoryview(pending)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        view.release()
+        pending.clear()
+
+    @staticmethod
+    def _timestamp() -> str:
+        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+    @staticmethod
+    def _encode_entry(timestamp: str, raw: bytes) -> bytes:
+        log_entry = {
+            "timestamp": timestamp,
+            "line": raw.decode("utf-8", errors="replace").rstrip("\r"),
+        }
+        return orjson.dumps(log_entry) + b"\n"
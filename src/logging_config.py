@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+ACCESS_LOGGER = "llm_shell.access"
+DEBUG_LOGGER = "llm_shell.debug"
+# Query marker on TUI polling requests; the access log drops them.
+TUI_CLIENT_PARAM = "client=tui"
+
+_access_listener: Optional[QueueListener] = None
+_access_handler: Optional[QueueHandler] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Leave %-formatting to the listener thread; access log args are plain values.
+        return record
+
+
+class _AccessLogFilter(logging.Filter):
+    # uvicorn.access records carry (client, method, full_path, http_version, status).
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        if not isinstance(args, tuple) or len(args) < 3:
+            return True
+        path, _, query = str(args[2]).partition("?")
+        return path != "/health" and TUI_CLIENT_PARAM not in query.split("&")
+
+
+def configure_logging() -> None:
+    # Called from lifespan startup, after uvicorn has applied its logging
+    # config. Safe to call repeatedly: handlers are attached only once.
+    global _access_listener, _access_handler
+    if _access_listener is None:
+        access_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        _access_listener = QueueListener(access_queue, handler)
+        _access_listener.start()
+        _access_handler = _DeferredQueueHandler(access_queue)
+        access_logger = logging.getLogger(ACCESS_LOGGER)
+        access_logger.addHandler(_access_handler)
+        access_logger.setLevel(logging.INFO)
+        access_logger.propagate = False
+
+    debug_logger = logging.getLogger(DEBUG_LOGGER)
+    if not debug_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("DEBUG: %(message)s"))
+        debug_logger.addHandler(handler)
+        debug_logger.setLevel(logging.WARNING)
+        debug_logger.propagate = False
+
+    uvicorn_access = logging.getLogger("uvicorn.access")
+    if not any(isinstance(f, _AccessLogFilter) for f in uvicorn_access.filters):
+        uvicorn_access.addFilter(_AccessLogFilter())
+
+
+def shutdown_logging() -> None:
+    # Flush queued access records and detach the queue handler.
+    global _access_listener, _access_handler
+    if _access_listener is None:
+        return
+    _access_listener.stop()
+    logging.getLogger(ACCESS_LOGGER).removeHandler(_access_handler)
+    _access_listener = None
+    _access_handler = None
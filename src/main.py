@@ -2,47 +2,38 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import importlib.util
 import logging
-import sys
 import time
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Optional
 
-import psutil
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 
 from .config import settings
 from .exceptions import BadRequestError, ConflictError, InternalError, NotFoundError
 from .log_manager import LogManager
+from .logging_config import ACCESS_LOGGER, DEBUG_LOGGER, configure_logging, shutdown_logging
 from .models import HealthResponse, KillResponse, LogsResponse, ProcessStatus
+from .process_info import ENRICHED_FIELDS, collect_process_info
 from .process_manager import ProcessManager
 from .tui import run_tui
 
 process_manager = ProcessManager()
 log_manager = LogManager(settings.log_dir)
-start_time = datetime.now(timezone.utc)
-_cpu_samples: dict[int, tuple[float, float]] = {}
-access_logger = logging.getLogger("llm_shell.access")
-if not access_logger.handlers:
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-    access_logger.addHandler(handler)
-    access_logger.setLevel(logging.INFO)
-    access_logger.propagate = False
-
-debug_logger = logging.getLogger("llm_shell.debug")
-if not debug_logger.handlers:
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(logging.Formatter("DEBUG: %(message)s"))
-    debug_logger.addHandler(handler)
-    debug_logger.setLevel(logging.DEBUG)
-    debug_logger.propagate = False
+start_monotonic = time.monotonic()
+access_logger = logging.getLogger(ACCESS_LOGGER)
+debug_logger = logging.getLogger(DEBUG_LOGGER)
 
 
 async def lifespan(app: FastAPI):
+    configure_logging()
     yield
     try:
         current_process = process_manager.get_process()
@@ -51,19 +42,41 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
     log_manager.stop_logging()
+    shutdown_logging()
 
 
-app = FastAPI(title="LLM Shell", version="1.0.0", lifespan=lifespan)
+def _orjson_default(obj):
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    # fastapi.responses.ORJSONResponse is deprecated in newer FastAPI releases.
+    # Handlers return this directly for JSON payloads so FastAPI skips
+    # jsonable_encoder; orjson handles datetimes natively. Timestamps stay
+    # ISO 8601 for existing clients, at whole-second precision.
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_OMIT_MICROSECONDS,
+        )
+
+
+app = FastAPI(title="LLM Shell", version="1.0.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content={"error": exc.detail})
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
+    return ORJSONResponse(status_code=exc.status_code, content={"error": exc.detail})
 
 
 @app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-    return JSONResponse(status_code=400, content={"error": "Invalid request", "details": exc.errors()})
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+    return ORJSONResponse(status_code=400, content={"error": "Invalid request", "details": exc.errors()})
 
 
 def _format_duration(seconds: Optional[int]) -> str:
@@ -78,108 +91,105 @@ def _format_duration(seconds: Optional[int]) -> str:
     return f"{sec}s"
 
 
-def _collect_ports(proc: psutil.Process) -> tuple[list[int], int]:
-    ports: list[int] = []
-    child_count = 0
-    try:
-        all_connections = proc.connections(kind="all")
-    except (psutil.AccessDenied, psutil.Error):
-        all_connections = []
-    ports.extend(conn.laddr.port for conn in all_connections if conn.laddr)
-    try:
-        children = proc.children(recursive=True) if proc.is_running() else []
-        child_count = len(children)
-    except (AttributeError, psutil.Error):
-        children = []
-    for child in children:
-        try:
-            child_connections = child.connections(kind="all")
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.Error):
-            continue
-        ports.extend(conn.laddr.port for conn in child_connections if conn.laddr)
-    ports = sorted(set(ports))
-    return ports, child_count
-
-
-def _collect_usage(proc: psutil.Process, children: list[psutil.Process]) -> tuple[Optional[float], Optional[int]]:
-    cpu_time_total = 0.0
-    mem_total = 0
-    collected = False
-    for target in [proc, *children]:
-        try:
-            if not target.is_running():
-                continue
-            mem_total += target.memory_info().rss
-            times = target.cpu_times()
-            cpu_time_total += float(times.user + times.system)
-            collected = True
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.Error):
-            continue
-    if not collected:
-        return None, None
-    now = time.time()
-    last = _cpu_samples.get(proc.pid)
-    _cpu_samples[proc.pid] = (now, cpu_time_total)
-    if not last:
-        return None, mem_total
-    last_time, last_cpu = last
-    delta_time = max(0.001, now - last_time)
-    delta_cpu = max(0.0, cpu_time_total - last_cpu)
-    cpu_percent = (delta_cpu / delta_time) * 100.0
-    return cpu_percent, mem_total
+# psutil enrichment is cached per PID for 1/_ENRICH_BUCKETS_PER_SECOND seconds.
+_ENRICH_BUCKETS_PER_SECOND = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _enrich_cached(pid: int, bucket: int) -> dict:
+    return collect_process_info(
+        process_manager.get_psutil_process(),
+        pid,
+        process_manager.get_static_info(),
+    )
+
+
+def _enrich_status(status: dict) -> None:
+    # Called via asyncio.to_thread: a cache miss does blocking /proc reads.
+    bucket = int(time.monotonic() * _ENRICH_BUCKETS_PER_SECOND)
+    status.update(_enrich_cached(status["process_pid"], bucket))
+    status.pop("log_file", None)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[set[str]]:
+    if fields is None:
+        return None
+    return {name.strip() for name in fields.split(",") if name.strip()}
+
+
+def _select_fields(payload: dict, requested: Optional[set[str]]) -> dict:
+    if requested is None:
+        return payload
+    return {key: value for key, value in payload.items() if key in requested}
+
+
+class _DashDict(dict):
+    def __missing__(self, key: str) -> str:
+        return "-"
+
+
+_STATUS_TEMPLATE = (
+    "status: {status}\n"
+    "pid: {process_pid}\n"
+    "uptime: {uptime}\n"
+    "command: {command}\n"
+    "user: {user}\n"
+    "ports: {ports_text}\n"
+    "cpu: {cpu_percent}\n"
+    "mem_mb: {memory_mb}\n"
+    "threads: {threads}\n"
+    "open_files: {open_files}\n"
+    "connections: {connections}\n"
+    "children: {children}\n"
+    "env_count: {env_count}"
+)
+_START_TEMPLATE = "command: {command}\nstatus: {status}\npid: {process_pid}\ncreated_at: {created_at}"
+_KILL_TEMPLATE = "status: {status}\ntype: {type}\nexit_code: {exit_code}\nstopped_at: {stopped_at}"
 
 
 def _status_text(payload: dict) -> str:
-    lines = []
-    lines.append(f"status: {payload.get('status', '-')}")
-    lines.append(f"pid: {payload.get('process_pid', '-')}")
-    lines.append(f"uptime: {_format_duration(payload.get('uptime_seconds'))}")
-    lines.append(f"command: {payload.get('command', '-')}")
-    lines.append(f"user: {payload.get('user', '-')}")
-    ports = payload.get("ports") or []
-    lines.append(f"ports: {','.join(str(p) for p in ports) if ports else '-'}")
-    lines.append(f"cpu: {payload.get('cpu_percent', '-')}")
-    lines.append(f"mem_mb: {payload.get('memory_mb', '-')}")
-    lines.append(f"threads: {payload.get('threads', '-')}")
-    lines.append(f"open_files: {payload.get('open_files', '-')}")
-    lines.append(f"connections: {payload.get('connections', '-')}")
-    lines.append(f"children: {payload.get('children', '-')}")
-    lines.append(f"env_count: {payload.get('env_count', '-')}")
-    
+    values = _DashDict(payload)
+    values["uptime"] = _format_duration(payload.get("uptime_seconds"))
+    ports = payload.get("ports")
+    values["ports_text"] = ",".join(str(p) for p in ports) if ports else "-"
+    text = _STATUS_TEMPLATE.format_map(values)
+
     # Add log_tail if present (for processes that exit immediately)
-    log_tail = payload.get('log_tail')
+    log_tail = payload.get("log_tail")
     if log_tail:
-        lines.append(f"\nLogs:\n{log_tail}")
-    
-    return "\n".join(lines)
+        text += f"\n\nLogs:\n{log_tail}"
+
+    return text
 
 
 def _start_text(payload: dict) -> str:
-    return "\n".join(
-        [
-            f"command: {payload.get('command', '-')}",
-            f"status: {payload.get('status', '-')}",
-            f"pid: {payload.get('process_pid', '-')}",
-            f"created_at: {payload.get('created_at', '-')}",
-        ]
-    )
+    return _START_TEMPLATE.format_map(_DashDict(payload))
 
 
 def _kill_text(payload: dict) -> str:
-    return "\n".join(
-        [
-            f"status: {payload.get('status', '-')}",
-            f"type: {payload.get('type', '-')}",
-            f"exit_code: {payload.get('exit_code', '-')}",
-            f"stopped_at: {payload.get('stopped_at', '-')}",
-        ]
-    )
+    return _KILL_TEMPLATE.format_map(_DashDict(payload))
+
 
+_NOT_STARTED_PAYLOAD = {
+    "command": "",
+    "status": "not_started",
+    "created_at": None,
+    "process_pid": None,
+    "stopped_at": None,
+    "exit_code": None,
+    **dict.fromkeys(ENRICHED_FIELDS),
+}
+# The status template has no created_at, so the unfiltered text never changes.
+_NOT_STARTED_TEXT = _status_text(_NOT_STARTED_PAYLOAD).encode()
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> dict:
-    uptime = int((datetime.now(timezone.utc) - start_time).total_seconds())
-    return {"status": "healthy", "version": "1.0.0", "uptime": uptime}
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
+    # Serialized by pydantic-core directly; responses= only documents the schema,
+    # so FastAPI does not revalidate the payload.
+    uptime = int(time.monotonic() - start_monotonic)
+    payload = HealthResponse(status="healthy", version="1.0.0", uptime=uptime)
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
 @app.post("/start", status_code=201)
@@ -187,16 +197,16 @@ async def start_process(request: Request, format: str = Query("text")):
     try:
         content_type = request.headers.get("content-type", "")
         command = ""
+        body = await request.body()
         if "application/json" in content_type:
             try:
-                payload = await request.json()
-            except Exception:
+                payload = orjson.loads(body) if body else None
+            except orjson.JSONDecodeError:
                 payload = None
             if isinstance(payload, dict):
                 command = str(payload.get("command", "") or "")
         else:
-            body = await request.body()
-            command = body.decode("utf-8", errors="ignore") if body else("")
+            command = body.decode("utf-8", errors="ignore") if body else ""
     except Exception as exc:
         raise HTTPException(status_code=400, detail="Invalid request body") from exc
 
@@ -206,82 +216,34 @@ async def start_process(request: Request, format: str = Query("text")):
     try:
         access_logger.info("start command=%r", command)
         log_file = log_manager.create_log_file()
-        status = process_manager.start(command, log_file)
+        loop = asyncio.get_running_loop()
+        exited = asyncio.Event()
+
+        def _notify_exit() -> None:
+            try:
+                loop.call_soon_threadsafe(exited.set)
+            except RuntimeError:
+                pass  # the request's event loop is already closed
+
+        status = process_manager.start(command, log_file, on_exit=_notify_exit)
+        _enrich_cached.cache_clear()
         log_manager.start_logging(process_manager.get_process(), log_file)
-        wait_until = time.monotonic() + 2.0
-        while True:
-            status = process_manager.get_status()
-            if status.get("status") == "exited":
-                break
-            remaining = wait_until - time.monotonic()
-            if remaining <= 0:
-                break
-            await asyncio.sleep(min(0.05, remaining))
+        try:
+            await asyncio.wait_for(exited.wait(), timeout=2.0)
+        except asyncio.TimeoutError:
+            pass
+        status = process_manager.get_status()
         if status.get("status") == "exited":
-            log_manager.stop_logging()  # Ensure log writer completes
-            await asyncio.sleep(0.5)  # Give thread time to flush
+            log_manager.stop_logging()  # Joins the writer after its final flush
             try:
                 log_tail = log_manager.read_logs(status["log_file"], lines=100).get("content", "")
             except (BadRequestError, NotFoundError):
                 log_tail = ""
             status["log_tail"] = log_tail
         if status.get("process_pid") and status.get("status") == "running":
-            try:
-                proc = psutil.Process(status["process_pid"])
-                user = proc.username()
-                ports, _ = _collect_ports(proc)
-                try:
-                    open_files = proc.open_files() if proc.is_running() else []
-                except (AttributeError, psutil.Error):
-                    open_files = []
-                try:
-                    conns = proc.connections(kind="inet") if proc.is_running() else []
-                except (AttributeError, psutil.Error):
-                    conns = []
-                try:
-                    children = proc.children(recursive=True) if proc.is_running() else []
-                except (AttributeError, psutil.Error):
-                    children = []
-                try:
-                    env = proc.environ() if proc.is_running() else {}
-                except (AttributeError, psutil.Error):
-                    env = {}
-                cpu_total, mem_total = _collect_usage(proc, children)
-                uptime_seconds = int(max(0.0, time.time() - proc.create_time()))
-                status.update(
-                    {
-                        "cpu_percent": cpu_total,
-                        "memory_mb": mem_total / (1024 * 1024) if mem_total is not None else None,
-                        "user": user,
-                        "ports": ports,
-                        "threads": proc.num_threads(),
-                        "open_files": len(open_files),
-                        "connections": len(conns),
-                        "children": len(children),
-                        "env_count": len(env),
-                        "env_keys": sorted(list(env.keys()))[:10],
-                        "uptime_seconds": uptime_seconds,
-                    }
-                )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                status.update(
-                    {
-                        "cpu_percent": None,
-                        "memory_mb": None,
-                        "user": None,
-                        "ports": None,
-                        "threads": None,
-                        "open_files": None,
-                        "connections": None,
-                        "children": None,
-                        "env_count": None,
-                        "env_keys": None,
-                        "uptime_seconds": None,
-                    }
-                )
-            status.pop("log_file", None)
+            await asyncio.to_thread(_enrich_status, status)
         if format == "json":
-            return status
+            return ORJSONResponse(status, status_code=201)
         return PlainTextResponse(_status_text(status))
     except ConflictError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
@@ -290,89 +252,27 @@ async def start_process(request: Request, format: str = Query("text")):
 
 
 @app.get("/status")
-async def get_status(format: str = Query("text")):
+async def get_status(format: str = Query("text"), fields: Optional[str] = Query(None)):
+    requested = _parse_fields(fields)
     try:
         status = process_manager.get_status()
-        if status.get("process_pid") and status.get("status") == "running":
-            try:
-                proc = psutil.Process(status["process_pid"])
-                user = proc.username()
-                ports, _ = _collect_ports(proc)
-                try:
-                    open_files = proc.open_files() if proc.is_running() else []
-                except (AttributeError, psutil.Error):
-                    open_files = []
-                try:
-                    conns = proc.connections(kind="inet") if proc.is_running() else []
-                except (AttributeError, psutil.Error):
-                    conns = []
-                try:
-                    children = proc.children(recursive=True) if proc.is_running() else []
-                except (AttributeError, psutil.Error):
-                    children = []
-                try:
-                    env = proc.environ() if proc.is_running() else {}
-                except (AttributeError, psutil.Error):
-                    env = {}
-                cpu_total, mem_total = _collect_usage(proc, children)
-                uptime_seconds = int(max(0.0, time.time() - proc.create_time()))
-                status.update(
-                    {
-                        "cpu_percent": cpu_total,
-                        "memory_mb": mem_total / (1024 * 1024) if mem_total is not None else None,
-                        "user": user,
-                        "ports": ports,
-                        "threads": proc.num_threads(),
-                        "open_files": len(open_files),
-                        "connections": len(conns),
-                        "children": len(children),
-                        "env_count": len(env),
-                        "env_keys": sorted(list(env.keys()))[:10],
-                        "uptime_seconds": uptime_seconds,
-                    }
-                )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                status.update(
-                    {
-                        "cpu_percent": None,
-                        "memory_mb": None,
-                        "user": None,
-                        "ports": None,
-                        "threads": None,
-                        "open_files": None,
-                        "connections": None,
-                        "children": None,
-                        "env_count": None,
-                        "env_keys": None,
-                        "uptime_seconds": None,
-                    }
-                )
-            status.pop("log_file", None)
+        if (
+            status.get("process_pid")
+            and status.get("status") == "running"
+            and (requested is None or not requested.isdisjoint(ENRICHED_FIELDS))
+        ):
+            await asyncio.to_thread(_enrich_status, status)
+        status = _select_fields(status, requested)
         if format == "json":
-            return status
+            return ORJSONResponse(status)
         return PlainTextResponse(_status_text(status))
     except NotFoundError:
-        payload = {
-            "command": "",
-            "status": "not_started",
-            "created_at": datetime.now(timezone.utc),
-            "process_pid": None,
-            "stopped_at": None,
-            "exit_code": None,
-            "cpu_percent": None,
-            "memory_mb": None,
-            "user": None,
-            "ports": None,
-            "threads": None,
-            "open_files": None,
-            "connections": None,
-            "children": None,
-            "env_count": None,
-            "env_keys": None,
-            "uptime_seconds": None,
-        }
+        if format != "json" and requested is None:
+            return PlainTextResponse(_NOT_STARTED_TEXT)
+        payload = {**_NOT_STARTED_PAYLOAD, "created_at": datetime.now(timezone.utc)}
+        payload = _select_fields(payload, requested)
         if format == "json":
-            return payload
+            return ORJSONResponse(payload)
         return PlainTextResponse(_status_text(payload))
 
 
@@ -383,9 +283,10 @@ async def kill_process(
 ):
     try:
         result = process_manager.kill(type)
+        _enrich_cached.cache_clear()
         log_manager.stop_logging()
         if format == "json":
-            return result
+            return ORJSONResponse(result)
         return PlainTextResponse(_kill_text(result))
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -399,10 +300,11 @@ async def restart_process(timeout: int = Query(10, ge=1), format: str = Query("t
         log_manager.stop_logging()
         log_file = log_manager.create_log_file()
         status = process_manager.restart(log_file=log_file, timeout=timeout)
+        _enrich_cached.cache_clear()
         log_manager.start_logging(process_manager.get_process(), log_file)
         status.pop("log_file", None)
         if format == "json":
-            return status
+            return ORJSONResponse(status)
         return PlainTextResponse(_start_text(status))
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -412,28 +314,59 @@ async def restart_process(timeout: int = Query(10, ge=1), format: str = Query("t
 
 @app.get("/logs", response_class=PlainTextResponse)
 async def get_logs(
+    request: Request,
     lines: Optional[int] = Query(None, ge=1),
     seconds: Optional[int] = Query(None, ge=1),
-) -> PlainTextResponse:
+) -> Response:
     try:
         status = process_manager.get_status()
-        result = log_manager.read_logs(status["log_file"], lines, seconds)
-        return PlainTextResponse(result["content"])
+        headers = {}
+        if seconds is None:
+            # A seconds window changes as entries age out, so only line and
+            # full reads are cacheable.
+            etag = log_manager.etag(status["log_file"], lines)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            headers["ETag"] = etag
+        # The sync iterator is consumed in Starlette's threadpool, keeping
+        # file reads and decoding off the event loop.
+        chunks = log_manager.iter_logs(status["log_file"], lines, seconds)
+        return StreamingResponse(chunks, media_type="text/plain", headers=headers)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except BadRequestError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
-@app.middleware("http")
-async def access_log_middleware(request: Request, call_next):
-    if request.headers.get("x-llm-shell-tui") == "1":
-        return await call_next(request)
+@app.get("/tui_frame")
+async def tui_frame(lines: int = Query(50, ge=1), logs_etag: Optional[str] = Query(None)):
+    # Status JSON plus the log tail in one round trip for the TUI poller.
+    # "logs" is the tail as a list of lines, or null when logs_etag still
+    # matches, so the client keeps its copy.
+    try:
+        status = process_manager.get_status()
+    except NotFoundError:
+        status = {**_NOT_STARTED_PAYLOAD, "created_at": datetime.now(timezone.utc)}
+        return ORJSONResponse({"status": status, "logs": [], "logs_etag": None})
+
+    log_file = status["log_file"]
+    if status.get("process_pid") and status.get("status") == "running":
+        await asyncio.to_thread(_enrich_status, status)
+    try:
+        etag = log_manager.etag(log_file, lines)
+        logs = None if etag == logs_etag else await asyncio.to_thread(log_manager.tail_lines, log_file, lines)
+    except NotFoundError:
+        etag, logs = None, []
+    return ORJSONResponse({"status": status, "logs": logs, "logs_etag": etag})
 
-    response = await call_next(request)
-    client = request.client.host if request.client else "-"
-    access_logger.info("%s %s %s %s", client, request.method, request.url.path, response.status_code)
-    return response
+
+def _uvicorn_loop() -> str:
+    # uvloop is not available on Windows; fall back to the stdlib event loop.
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def _uvicorn_http() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
 
 
 def main() -> None:
@@ -443,7 +376,17 @@ def main() -> None:
     parser.add_argument("--tui", action="store_true", help="Run with console UI")
     parser.add_argument("--poll", type=float, default=0.5, help="TUI polling interval (seconds)")
     parser.add_argument("--lines", type=int, default=50, help="TUI app log lines to show")
-    parser.add_argument("--access-log", action="store_true", help="Enable uvicorn access log")
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Enable the access log even if LLM_SHELL_ACCESS_LOG is off",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of uvicorn workers (process state is not shared between workers)",
+    )
     args = parser.parse_args()
 
     if args.tui:
@@ -455,7 +398,10 @@ def main() -> None:
         host=args.host,
         port=args.port,
         log_level="info",
-        access_log=args.access_log,
+        access_log=args.access_log or settings.access_log,
+        loop=_uvicorn_loop(),
+        http=_uvicorn_http(),
+        workers=args.workers,
     )
 
 
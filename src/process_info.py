@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import psutil
+
+ENRICHED_FIELDS = (
+    "cpu_percent",
+    "memory_mb",
+    "user",
+    "ports",
+    "threads",
+    "open_files",
+    "connections",
+    "children",
+    "env_count",
+    "env_keys",
+    "uptime_seconds",
+)
+
+_PROC_ATTRS = ["memory_info", "cpu_times", "num_threads", "open_files", "net_connections"]
+_USAGE_ATTRS = ["memory_info", "cpu_times"]
+# Collect listening ports from the whole process tree instead of direct children only.
+_PORT_RECURSIVE = False
+
+_cpu_samples: dict[int, tuple[float, float]] = {}
+
+
+def _collect_ports(
+    proc: psutil.Process,
+    connections: list,
+    children: list[psutil.Process],
+) -> list[int]:
+    ports = {conn.laddr.port for conn in connections if conn.laddr}
+    for child in children:
+        try:
+            if not _PORT_RECURSIVE and child.ppid() != proc.pid:
+                continue
+            child_connections = child.net_connections(kind="inet")
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.Error):
+            continue
+        ports.update(conn.laddr.port for conn in child_connections if conn.laddr)
+    return sorted(ports)
+
+
+def _usage_info(target: psutil.Process) -> Optional[dict]:
+    try:
+        return target.as_dict(attrs=_USAGE_ATTRS)
+    except (psutil.NoSuchProcess, psutil.Error):
+        return None
+
+
+def _collect_usage(
+    proc: psutil.Process,
+    info: dict,
+    children: list[psutil.Process],
+    create_time: float,
+) -> tuple[Optional[float], Optional[int]]:
+    cpu_time_total = 0.0
+    mem_total = 0
+    collected = False
+    for sample in [info, *(_usage_info(child) for child in children)]:
+        if not sample or sample["memory_info"] is None or sample["cpu_times"] is None:
+            continue
+        mem_total += sample["memory_info"].rss
+        times = sample["cpu_times"]
+        cpu_time_total += float(times.user + times.system)
+        collected = True
+    if not collected:
+        return None, None
+    now = time.time()
+    # A new process tree has used no CPU at its creation time, so that is the
+    # baseline for the first sample instead of reporting nothing.
+    last_time, last_cpu = _cpu_samples.get(proc.pid, (create_time, 0.0))
+    _cpu_samples[proc.pid] = (now, cpu_time_total)
+    delta_time = max(0.001, now - last_time)
+    delta_cpu = max(0.0, cpu_time_total - last_cpu)
+    cpu_percent = (delta_cpu / delta_time) * 100.0
+    return cpu_percent, mem_total
+
+
+def collect_process_info(proc: Optional[psutil.Process], pid: int, static_info: dict) -> dict:
+    try:
+        if proc is None or proc.pid != pid:
+            raise psutil.NoSuchProcess(pid)
+        # as_dict reads all attributes inside a single oneshot() pass, and the
+        # connection list is fetched once and shared by ports and the count.
+        info = proc.as_dict(attrs=_PROC_ATTRS)
+        try:
+            children = proc.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.Error):
+            children = []
+        connections = info["net_connections"] or []
+        ports = _collect_ports(proc, connections, children)
+        cpu_total, mem_total = _collect_usage(proc, info, children, static_info["create_time"])
+        uptime_seconds = int(max(0.0, time.time() - static_info["create_time"]))
+        return {
+            "cpu_percent": cpu_total,
+            "memory_mb": mem_total / (1024 * 1024) if mem_total is not None else None,
+            "user": static_info["user"],
+            "ports": ports,
+            "threads": info["num_threads"],
+            "open_files": len(info["open_files"] or []),
+            "connections": len(connections),
+            "children": len(children),
+            "env_count": static_info["env_count"],
+            "env_keys": static_info["env_keys"],
+            "uptime_seconds": uptime_seconds,
+        }
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return dict.fromkeys(ENRICHED_FIELDS)
@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional
 
+import heapq
 import os
 import signal
 import subprocess
+import threading
 
 import psutil
 
@@ -19,9 +21,16 @@ class ProcessManager:
         self._stopped_at: Optional[datetime] = None
         self._exit_code: Optional[int] = None
         self._status_override: Optional[str] = None
-
-    def start(self, command: str, log_file: str) -> dict:
-        self._update_status()
+        self._psutil_proc: Optional[psutil.Process] = None
+        self._static_info: dict = {}
+        self._exited = threading.Event()
+
+    def start(
+        self,
+        command: str,
+        log_file: str,
+        on_exit: Optional[Callable[[], None]] = None,
+    ) -> dict:
         if self.is_running():
             raise ConflictError("Process already running")
 
@@ -45,26 +54,42 @@ class ProcessManager:
         except Exception as exc:
             raise InternalError(f"Failed to start process: {exc}") from exc
 
+        self._exited = threading.Event()
+        self._register_psutil(self._process.pid)
+        threading.Thread(
+            target=self._wait_for_exit,
+            args=(self._process, self._exited, on_exit),
+            daemon=True,
+        ).start()
         return self._get_status_dict()
 
     def get_status(self) -> dict:
         if self._process is None:
             raise NotFoundError("No process started")
 
-        self._update_status()
         return self._get_status_dict()
 
     def get_process(self) -> Optional[subprocess.Popen]:
         return self._process
 
+    def get_psutil_process(self) -> Optional[psutil.Process]:
+        if self._process is None:
+            return None
+        if self._psutil_proc is None or self._psutil_proc.pid != self._process.pid:
+            self._register_psutil(self._process.pid)
+        return self._psutil_proc
+
+    def get_static_info(self) -> dict:
+        return self._static_info
+
     def is_running(self) -> bool:
-        return self._process is not None and self._process.poll() is None
+        # Served from the exit latch set by the waiter thread: no waitpid per call.
+        return self._process is not None and not self._exited.is_set()
 
     def kill(self, signal_type: str) -> dict:
         if self._process is None:
             raise NotFoundError("No process to kill")
 
-        self._update_status()
         if not self.is_running():
             raise BadRequestError("Process already exited")
 
@@ -125,6 +150,7 @@ class ProcessManager:
             self._status_override = None
             raise InternalError("Failed to terminate process group")
 
+        self._exited.wait(timeout=1)
         self._exit_code = exit_code
         self._stopped_at = datetime.now(timezone.utc)
         self._status_override = "killed"
@@ -140,7 +166,6 @@ class ProcessManager:
         if self._process is None or self._command is None:
             raise NotFoundError("No process to restart")
 
-        self._update_status()
         if self.is_running():
             self._process.terminate()
             try:
@@ -148,20 +173,48 @@ class ProcessManager:
             except subprocess.TimeoutExpired:
                 self._process.kill()
                 self._process.wait()
+            # Let the waiter thread record the exit before start() checks the latch.
+            self._exited.wait(timeout=1)
 
         return self.start(self._command, log_file)
 
     def set_log_file(self, log_file: str) -> None:
         self._log_file = log_file
 
-    def _update_status(self) -> None:
-        if self._process is None:
-            return
-
-        exit_code = self._process.poll()
-        if exit_code is not None and self._exit_code is None:
+    def _wait_for_exit(
+        self,
+        process: subprocess.Popen,
+        exited: threading.Event,
+        on_exit: Optional[Callable[[], None]],
+    ) -> None:
+        exit_code = process.wait()
+        # Record the exit before setting the latch so readers that see it
+        # also see exit_code; a newer process started meanwhile is left alone.
+        if process is self._process and self._exit_code is None:
             self._exit_code = exit_code
             self._stopped_at = datetime.now(timezone.utc)
+        exited.set()
+        if on_exit is not None:
+            on_exit()
+
+    def _register_psutil(self, pid: int) -> None:
+        # username, create_time and environ never change for a given process,
+        # so they are read once here instead of on every status request.
+        self._psutil_proc = None
+        self._static_info = {}
+        try:
+            proc = psutil.Process(pid)
+            static_info = {"user": proc.username(), "create_time": proc.create_time()}
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.Error):
+            return
+        try:
+            env = proc.environ()
+        except (AttributeError, psutil.Error):
+            env = {}
+        static_info["env_count"] = len(env)
+        static_info["env_keys"] = heapq.nsmallest(10, env.keys())
+        self._psutil_proc = proc
+        self._static_info = static_info
 
     def _get_status_dict(self) -> dict:
         if self._status_override == "killed":
@@ -2,83 +2,249 @@ from __future__ import annotations
 
 import argparse
 import curses
-import json
+import functools
+import http.client
+import os
+import selectors
 import subprocess
 import sys
 import threading
 import time
-import urllib.error
-import urllib.request
+import urllib.parse
 from collections import deque
-from datetime import datetime, timezone
-from typing import Deque, Optional
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Deque, Optional, Sequence
 import signal
 
-
-def _read_lines(stream, buffer: Deque[str], stop_event: threading.Event) -> None:
-    while not stop_event.is_set():
-        line = stream.readline()
-        if not line:
-            time.sleep(0.05)
-            continue
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        buffer.append(f"{timestamp} {line.rstrip('\n')}")
-
-
-def _get_json(url: str, headers: Optional[dict] = None) -> Optional[dict]:
-    try:
-        request = urllib.request.Request(url, headers=headers or {})
-        with urllib.request.urlopen(request, timeout=2) as response:
-            payload = response.read().decode("utf-8")
-            return json.loads(payload)
-    except (urllib.error.URLError, json.JSONDecodeError):
-        return None
-
-
-def _get_text(url: str, headers: Optional[dict] = None) -> Optional[str]:
-    try:
-        request = urllib.request.Request(url, headers=headers or {})
-        with urllib.request.urlopen(request, timeout=2) as response:
-            return response.read().decode("utf-8")
-    except urllib.error.URLError:
-        return None
-
-
-def _post_json(url: str, headers: Optional[dict] = None) -> Optional[dict]:
-    try:
-        request = urllib.request.Request(url, method="POST", headers=headers or {})
-        with urllib.request.urlopen(request, timeout=2) as response:
-            payload = response.read().decode("utf-8")
-            return json.loads(payload)
-    except (urllib.error.URLError, json.JSONDecodeError):
-        return None
-
-
-def _parse_time(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    normalized = value.replace("Z", "+00:00")
-    parsed = datetime.fromisoformat(normalized)
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
-
-
-def _format_uptime(created_at: Optional[str]) -> str:
-    parsed = _parse_time(created_at)
-    if not parsed:
-        return "-"
-    delta = datetime.now(timezone.utc) - parsed
-    seconds = int(delta.total_seconds())
-    if seconds < 0:
-        return "-"
-    minutes, sec = divmod(seconds, 60)
-    hours, minutes = divmod(minutes, 60)
-    if hours:
-        return f"{hours}h{minutes:02d}m{sec:02d}s"
-    if minutes:
-        return f"{minutes}m{sec:02d}s"
-    return f"{sec}s"
+import orjson
+
+from .logging_config import TUI_CLIENT_PARAM
+
+_IDLE_STATES = {"not_started", "exited", "killed"}
+_READ_WAIT = 0.2
+_READ_SIZE = 64 * 1024
+_IDLE_POLL_MAX = 5.0
+_ERROR_POLL_MAX = 30.0
+_ERROR_BACKOFF = 1.3
+_STABLE_POLL_STEP = 0.1
+_STABLE_POLL_MAX = 6.0
+_STATUS_PANE = "status"
+_API_PANE = "api"
+_APP_PANE = "app"
+_ALL_PANES = frozenset({_STATUS_PANE, _API_PANE, _APP_PANE})
+
+
+def _run_background(
+    stream,
+    buffer: Deque[str],
+    stop_event: threading.Event,
+    poll_once: Callable[[], float],
+    on_lines: Optional[Callable[[], None]] = None,
+) -> None:
+    # One thread serves both the API server pipe and the HTTP poll: the
+    # selector waits for output until the next poll is due, then whatever
+    # arrived is taken with one os.read and split into lines here. The wait
+    # is capped at _READ_WAIT so stop_event is honoured while all is quiet.
+    partial = b""
+    next_poll = time.monotonic()
+    with selectors.DefaultSelector() as selector:
+        fd: Optional[int] = None
+        if stream is not None:
+            fd = stream.fileno()
+            os.set_blocking(fd, False)
+            selector.register(fd, selectors.EVENT_READ)
+        while not stop_event.is_set():
+            wait = next_poll - time.monotonic()
+            if wait <= 0:
+                next_poll = time.monotonic() + poll_once()
+                continue
+            if fd is None:
+                stop_event.wait(min(wait, _READ_WAIT))
+                continue
+            if not selector.select(timeout=min(wait, _READ_WAIT)):
+                continue
+            try:
+                chunk = os.read(fd, _READ_SIZE)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                # The API server closed its output; keep polling without it.
+                selector.unregister(fd)
+                fd = None
+                continue
+            *lines, partial = (partial + chunk).split(b"\n")
+            if lines:
+                prefix = f"{_clock()} "
+                buffer.extend(prefix + line.rstrip(b"\r").decode("utf-8", errors="replace") for line in lines)
+                if on_lines is not None:
+                    on_lines()
+
+
+def _clock(now: Optional[float] = None) -> str:
+    # time.strftime on a struct_time is much cheaper than building a datetime.
+    return time.strftime("%H:%M:%S", time.gmtime(now))
+
+
+_LABEL_WIDTH = 8
+_VALUE_WIDTH = 12
+# Status labels padded once, so a row is a single f-string.
+_LBL_STATUS = "STATUS".ljust(_LABEL_WIDTH)
+_LBL_PID = "PID".ljust(_LABEL_WIDTH)
+_LBL_UPTIME = "UPTIME".ljust(_LABEL_WIDTH)
+_LBL_USER = "USER".ljust(_LABEL_WIDTH)
+_LBL_THR = "THR".ljust(_LABEL_WIDTH)
+_LBL_FILES = "FILES".ljust(_LABEL_WIDTH)
+_LBL_CONNS = "CONNS".ljust(_LABEL_WIDTH)
+_LBL_CHILD = "CHILD".ljust(_LABEL_WIDTH)
+_LBL_ENV = "ENV".ljust(_LABEL_WIDTH)
+_LBL_PORTS = "PORTS".ljust(_LABEL_WIDTH)
+_LBL_CPU = "CPU".ljust(_LABEL_WIDTH)
+_LBL_MEM = "MEM".ljust(_LABEL_WIDTH)
+# Runtime rows while no process is running never change.
+_IDLE_STATUS_ROWS = tuple(
+    f"{label}-"
+    for label in (_LBL_PID, _LBL_UPTIME, _LBL_USER, _LBL_THR, _LBL_FILES, _LBL_CONNS, _LBL_CHILD, _LBL_ENV, _LBL_PORTS)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _StatusSnapshot:
+    status: str = "-"
+    pid: object = "-"
+    command: str = "-"
+    uptime: str = "-"
+    cpu: str = "-"
+    mem: str = "-"
+    user: str = "-"
+    threads: object = "-"
+    open_files: object = "-"
+    connections: object = "-"
+    children: object = "-"
+    env_count: object = "-"
+    ports: str = "-"
+    io_rate: str = "-"
+    cpu_history: tuple[float, ...] = ()
+    mem_history: tuple[float, ...] = ()
+    io_history: tuple[float, ...] = ()
+    # Rendered once per snapshot by the background thread: every row that does not
+    # depend on the pane width, and the CPU/MEM rows up to their sparklines.
+    rows: tuple[str, ...] = field(init=False, compare=False)
+    cpu_row: str = field(init=False, compare=False)
+    mem_row: str = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.status == "running":
+            rows = (
+                f"{_LBL_STATUS}{self.status}",
+                f"{_LBL_PID}{self.pid}",
+                f"{_LBL_UPTIME}{self.uptime}",
+                f"{_LBL_USER}{self.user}",
+                f"{_LBL_THR}{self.threads}",
+                f"{_LBL_FILES}{self.open_files}",
+                f"{_LBL_CONNS}{self.connections}",
+                f"{_LBL_CHILD}{self.children}",
+                f"{_LBL_ENV}{self.env_count}",
+                f"{_LBL_PORTS}{self.ports or '-'}",
+            )
+            cpu, mem = self.cpu, self.mem
+        else:
+            rows = (f"{_LBL_STATUS}{self.status}", *_IDLE_STATUS_ROWS)
+            cpu = mem = "-"
+        object.__setattr__(self, "rows", rows)
+        object.__setattr__(self, "cpu_row", f"{_LBL_CPU}{cpu:<{_VALUE_WIDTH}}")
+        object.__setattr__(self, "mem_row", f"{_LBL_MEM}{mem:<{_VALUE_WIDTH}}")
+
+
+class _Damage:
+    # Panes changed since the last frame. Writers mark them; the render loop
+    # takes the whole set at once and redraws only those windows.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._panes: set[str] = set()
+        self._event = threading.Event()
+
+    def mark(self, *panes: str) -> None:
+        with self._lock:
+            self._panes.update(panes)
+            self._event.set()
+
+    def take(self, timeout: float) -> set[str]:
+        self._event.wait(timeout)
+        with self._lock:
+            panes, self._panes = self._panes, set()
+            self._event.clear()
+        return panes
+
+
+def _merge_tail(buffer: Deque[str], lines: list[str]) -> bool:
+    # Make buffer equal to lines, keeping the entries it already holds: a
+    # sliding tail normally shares all but its newest lines with the last poll.
+    # Returns False when buffer already held exactly these lines.
+    current = list(buffer)
+    if current == lines:
+        return False
+    for start in range(max(0, len(current) - len(lines)), len(current)):
+        overlap = len(current) - start
+        if current[start:] == lines[:overlap]:
+            buffer.extend(lines[overlap:])
+            for _ in range(len(buffer) - len(lines)):
+                buffer.popleft()
+            return True
+    buffer.clear()
+    buffer.extend(lines)
+    return True
+
+
+# Errors meaning the server closed a kept-alive connection before answering.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class _ApiConnection:
+    # A keep-alive HTTP connection to the API server, so each request skips
+    # the TCP handshake. Requests on one connection are serialized.
+    def __init__(self, host: str, port: int, timeout: float = 2.0) -> None:
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def request_json(self, method: str, path: str) -> Optional[dict]:
+        with self._lock:
+            while True:
+                reused = self._conn is not None
+                if self._conn is None:
+                    self._conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+                try:
+                    self._conn.request(method, path)
+                    response = self._conn.getresponse()
+                    payload = response.read()
+                except _STALE_CONNECTION_ERRORS:
+                    self._close()
+                    if reused:
+                        continue  # The server dropped the idle connection; retry once fresh.
+                    return None
+                except (OSError, http.client.HTTPException):
+                    # Timeouts and other failures may have reached the server
+                    # (a POST /kill must not be sent twice), so never retry.
+                    self._close()
+                    return None
+                if response.status >= 400:
+                    return None
+                try:
+                    return orjson.loads(payload)
+                except orjson.JSONDecodeError:
+                    return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
 
 def _format_duration(seconds: Optional[int]) -> str:
@@ -95,51 +261,112 @@ def _format_duration(seconds: Optional[int]) -> str:
     return f"{sec}s"
 
 
-def _draw_pane(
-    stdscr,
-    y: int,
-    x: int,
-    height: int,
-    width: int,
-    title: str,
-    lines: Deque[str],
-) -> None:
+def _new_window(height: int, width: int, y: int, x: int):
+    # A pane that does not fit the terminal is simply not drawn.
     if height <= 0 or width <= 1:
+        return None
+    try:
+        return curses.newwin(height, width, y, x)
+    except curses.error:
+        return None
+
+
+def _create_windows(stdscr) -> tuple:
+    # The three panes live in their own windows, built once per terminal
+    # size, so a frame only marks them for output and curses diffs the rest.
+    height, width = stdscr.getmaxyx()
+    split = height // 2
+    side_width = min(width, max(28, width // 3))
+    right_width = min(width - side_width, max(20, width - side_width))
+    right_x = side_width
+    stdscr.erase()
+    stdscr.noutrefresh()
+    return (
+        _new_window(height, side_width, 0, 0),
+        _new_window(split, right_width, 0, right_x),
+        _new_window(height - split, right_width, split, right_x),
+    )
+
+
+def _pane_width(win) -> int:
+    return win.getmaxyx()[1] if win is not None else 0
+
+
+def _draw_pane(win, title: str, lines: Sequence[str]) -> None:
+    if win is None:
         return
+    height, width = win.getmaxyx()
     max_width = max(1, width - 1)
+    # erase() only clears this window's buffer; doupdate() later sends just
+    # the cells that differ from what the terminal already shows.
+    win.erase()
     try:
-        stdscr.addstr(y, x, title.ljust(max_width)[:max_width], curses.A_REVERSE)
+        win.addnstr(0, 0, title, max_width, curses.A_REVERSE)
+        if len(title) < max_width:
+            win.chgat(0, len(title), max_width - len(title), curses.A_REVERSE)
     except curses.error:
+        win.noutrefresh()
         return
     max_lines = max(0, height - 1)
-    visible = list(lines)[-max_lines:]
-    for idx in range(max_lines):
-        line = visible[idx] if idx < len(visible) else ""
+    # Walk only the visible tail from the right end instead of copying the deque.
+    visible = list(islice(reversed(lines), max_lines))
+    visible.reverse()
+    for idx, line in enumerate(visible):
+        if not line:
+            continue
         try:
-            stdscr.addstr(y + 1 + idx, x, line.ljust(max_width)[:max_width])
+            win.addnstr(1 + idx, 0, line, max_width)
         except curses.error:
             break
+    win.noutrefresh()
 
 
 def _wrap_text(text: str, max_width: int) -> list[str]:
     if max_width <= 1:
         return [text]
-    words = text.split(" ")
     lines: list[str] = []
-    current = ""
-    for word in words:
-        candidate = f"{current} {word}".strip()
-        if len(candidate) <= max_width:
-            current = candidate
+    current: list[str] = []
+    length = 0
+    for word in text.split(" "):
+        if not word:
+            continue
+        if current and length + 1 + len(word) > max_width:
+            lines.append(" ".join(current))
+            current = []
+        if current:
+            length += 1 + len(word)
         else:
-            if current:
-                lines.append(current)
-            current = word
+            length = len(word)
+        current.append(word)
     if current:
-        lines.append(current)
+        lines.append(" ".join(current))
     return lines
 
 
+@functools.lru_cache(maxsize=1024)
+def _wrap_cached(text: str, max_width: int) -> tuple[str, ...]:
+    # Wrapping is a pure function of (line, width); log lines repeat across
+    # frames, and a width change simply misses the cache.
+    return tuple(_wrap_text(text, max_width))
+
+
+def _wrap_tail(win, lines: Deque[str]) -> list[str]:
+    # Wrap from the newest line backwards and stop once the pane is full,
+    # rather than wrapping the whole buffer on every frame.
+    if win is None:
+        return []
+    height, width = win.getmaxyx()
+    max_rows = max(0, height - 1)
+    wrap_width = max(1, width - 2)
+    rows: list[str] = []
+    for line in reversed(lines):
+        if len(rows) >= max_rows:
+            break
+        rows.extend(reversed(_wrap_cached(line, wrap_width)))
+    rows.reverse()
+    return rows
+
+
 def _format_bytes(value: Optional[int]) -> str:
     if value is None:
         return "-"
@@ -152,83 +379,84 @@ def _format_bytes(value: Optional[int]) -> str:
     return f"{size:.1f} {units[idx]}"
 
 
+_SPARK_LEVELS = "▁▂▃▄▅▆▇█"
+# Glyph for every whole percentage, so each sample is one clamp and one lookup.
+_SPARK_TABLE = tuple(_SPARK_LEVELS[round(pct / 100 * (len(_SPARK_LEVELS) - 1))] for pct in range(101))
+
+
 def _sparkline(values: list[float], max_points: int) -> str:
     if not values:
         return "-"
-    levels = "▁▂▃▄▅▆▇█"
-    trimmed = values[-max_points:]
-    scaled = []
-    for value in trimmed:
-        clamped = max(0.0, min(100.0, value))
-        idx = int(round((clamped / 100.0) * (len(levels) - 1)))
-        scaled.append(levels[idx])
-    return "".join(scaled)
-
-
-def _run_tui(stdscr, api_lines: Deque[str], app_lines: Deque[str], status_info: dict, status_lock: threading.Lock, stop_event: threading.Event, kill_term, kill_kill) -> None:
+    table = _SPARK_TABLE
+    return "".join([
+        table[100 if value >= 100 else 0 if value <= 0 else int(value + 0.5)]
+        for value in values[-max_points:]
+    ])
+
+
+def _draw_frame(
+    windows: tuple,
+    panes: set[str] | frozenset[str],
+    api_lines: Deque[str],
+    app_lines: Deque[str],
+    status: _StatusSnapshot,
+    spark_cache: dict,
+) -> None:
+    status_win, api_win, app_win = windows
+    if _STATUS_PANE in panes:
+        _draw_status_pane(status_win, status, spark_cache)
+    if _API_PANE in panes:
+        _draw_pane(api_win, " API SERVER LOGS (q to quit) ", api_lines)
+    if _APP_PANE in panes:
+        _draw_pane(app_win, " APP LOGS (k to SIGTERM, K/9 to SIGKILL))", _wrap_tail(app_win, app_lines))
+    curses.doupdate()
+
+
+def _draw_status_pane(status_win, status: _StatusSnapshot, spark_cache: dict) -> None:
+    side_width = _pane_width(status_win)
+    spark_width = max(1, side_width - _LABEL_WIDTH - _VALUE_WIDTH - 1)
+
+    def spark(label: str, history: tuple[float, ...]) -> str:
+        # Sparklines scan the whole history; reuse the previous one until the
+        # poller publishes a different history or the pane width changes.
+        key = (history, spark_width)
+        cached = spark_cache.get(label)
+        if cached is None or cached[0] != key:
+            cached = (key, _sparkline(history, spark_width))
+            spark_cache[label] = cached
+        return cached[1]
+
+    command = status.command or "-"
+    status_lines = [
+        *status.rows,
+        status.cpu_row + spark(_LBL_CPU, status.cpu_history),
+        status.mem_row + spark(_LBL_MEM, status.mem_history),
+        "",
+        "COMMAND:",
+        *_wrap_cached(command, side_width - 2),
+    ]
+    _draw_pane(status_win, " STATUS ", status_lines)
+
+
+def _run_tui(stdscr, api_lines: Deque[str], app_lines: Deque[str], snapshot_ref: list, stop_event: threading.Event, damage: _Damage, kill_term, kill_kill) -> None:
     curses.curs_set(0)
     stdscr.nodelay(True)
 
     try:
+        panes: set[str] | frozenset[str] = _ALL_PANES
+        last_size = None
+        windows: tuple = ()
+        spark_cache: dict = {}
         while not stop_event.is_set():
-            stdscr.erase()
-            height, width = stdscr.getmaxyx()
-            split = height // 2
-            side_width = max(28, width // 3)
-            right_width = max(20, width - side_width)
-            right_x = side_width
-
-            with status_lock:
-                status = status_info.copy()
-
-            current_status = status.get("status", "-")
-            show_runtime = current_status == "running"
-
-            status_lines = deque(maxlen=100)
-            label_width = 8
-            value_width = 12
-            spark_width = max(1, side_width - label_width - value_width - 1)
-            def row(label: str, value: str) -> str:
-                return f"{label.ljust(label_width)}{value}"
-
-            def row_with_spark(label: str, value: str, history: list[float]) -> str:
-                spark = _sparkline(history, spark_width)
-                return f"{label.ljust(label_width)}{value.ljust(value_width)}{spark}"
-
-            status_lines.append(row("STATUS", current_status))
-            status_lines.append(row("PID", str(status.get('pid', '-') if show_runtime else '-')))
-            status_lines.append(row("UPTIME", str(status.get('uptime', '-') if show_runtime else '-')))
-            status_lines.append(row("USER", str(status.get('user', '-') if show_runtime else '-')))
-            status_lines.append(row("THR", str(status.get('threads', '-') if show_runtime else '-')))
-            status_lines.append(row("FILES", str(status.get('open_files', '-') if show_runtime else '-')))
-            status_lines.append(row("CONNS", str(status.get('connections', '-') if show_runtime else '-')))
-            status_lines.append(row("CHILD", str(status.get('children', '-') if show_runtime else '-')))
-            status_lines.append(row("ENV", str(status.get('env_count', '-') if show_runtime else '-')))
-            ports = status.get("ports") if show_runtime else None
-            status_lines.append(row("PORTS", str(ports if ports else '-')))
-
-            cpu_value = str(status.get('cpu', '-') if show_runtime else '-')
-            mem_value = str(status.get('mem', '-') if show_runtime else '-')
-            io_value = str(status.get('io_rate', '-') if show_runtime else '-')
-            status_lines.append(row_with_spark("CPU", cpu_value, status.get("cpu_history", [])))
-            status_lines.append(row_with_spark("MEM", mem_value, status.get("mem_history", [])))
-            status_lines.append("")
-            status_lines.append("COMMAND:")
-            command = status.get("command", "-") or "-"
-            for line in _wrap_text(command, side_width - 2):
-                status_lines.append(line)
-
-            wrapped_app_lines = deque()
-            wrap_width = max(1, right_width - 2)
-            for line in app_lines:
-                for wrapped_line in _wrap_text(line, wrap_width):
-                    wrapped_app_lines.append(wrapped_line)
-
-            _draw_pane(stdscr, 0, 0, height, side_width, " STATUS ", status_lines)
-            _draw_pane(stdscr, 0, right_x, split, right_width, " API SERVER LOGS (q to quit) ", api_lines)
-            _draw_pane(stdscr, split, right_x, height - split, right_width, " APP LOGS (k to SIGTERM, K/9 to SIGKILL))", wrapped_app_lines)
-
-            stdscr.refresh()
+            # Redraw only the panes the poll/reader threads marked as changed,
+            # or every pane after a resize.
+            size = stdscr.getmaxyx()
+            if size != last_size:
+                windows = _create_windows(stdscr)
+                panes = _ALL_PANES
+                last_size = size
+            if panes:
+                _draw_frame(windows, panes, api_lines, app_lines, snapshot_ref[0], spark_cache)
             ch = stdscr.getch()
             if ch in (ord("q"), ord("Q")):
                 stop_event.set()
@@ -237,7 +465,7 @@ def _run_tui(stdscr, api_lines: Deque[str], app_lines: Deque[str], status_info:
                 kill_term()
             if ch in (ord("K"), ord("9")):
                 kill_kill()
-            time.sleep(0.1)
+            panes = damage.take(timeout=0.1)
     except KeyboardInterrupt:
         stop_event.set()
         return
@@ -265,17 +493,9 @@ def run_tui(host: str, port: int, attach: bool, poll: float, lines: int) -> None
     api_lines: Deque[str] = deque(maxlen=500)
     app_lines: Deque[str] = deque(maxlen=500)
     stop_event = threading.Event()
-    status_lock = threading.Lock()
-    status_info = {
-        "status": "-",
-        "pid": "-",
-        "command": "-",
-        "uptime": "-",
-        "cpu": "-",
-        "mem": "-",
-        "user": "-",
-        "ports": "-",
-    }
+    damage = _Damage()
+    # The background thread replaces the snapshot; the render loop only reads it.
+    snapshot_ref = [_StatusSnapshot()]
     last_status: Optional[str] = None
     cpu_history: Deque[float] = deque(maxlen=400)
     mem_history: Deque[float] = deque(maxlen=400)
@@ -302,108 +522,161 @@ def run_tui(host: str, port: int, attach: bool, poll: float, lines: int) -> None
             ],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
         )
-
-        threading.Thread(
-            target=_read_lines,
-            args=(api_process.stdout, api_lines, stop_event),
-            daemon=True,
-        ).start()
     else:
         api_lines.append("[attach] API server logs are not captured in attach mode")
 
-    def poll_app_logs() -> None:
-        base_url = f"http://{host}:{port}"
-        headers = {"x-llm-shell-tui": "1"}
-        nonlocal last_status, last_io_total, last_io_time
-        while not stop_event.is_set():
-            status = _get_json(f"{base_url}/status?format=json", headers=headers)
-            if status:
-                with status_lock:
-                    status_info["status"] = status.get("status") or "-"
-                    status_info["pid"] = status.get("process_pid") or "-"
-                    status_info["command"] = status.get("command") or "-"
-                    uptime_seconds = status.get("uptime_seconds")
-                    status_info["uptime"] = _format_duration(uptime_seconds)
-                    cpu = status.get("cpu_percent")
-                    mem = status.get("memory_mb")
-                    status_info["cpu"] = f"{cpu:.1f}%" if isinstance(cpu, (int, float)) else "-"
-                    status_info["mem"] = f"{mem:.1f} MB" if isinstance(mem, (int, float)) else "-"
-                    status_info["user"] = status.get("user") or "-"
-                    status_info["threads"] = status.get("threads")
-                    status_info["open_files"] = status.get("open_files")
-                    status_info["connections"] = status.get("connections")
-                    status_info["children"] = status.get("children")
-                    status_info["env_count"] = status.get("env_count")
-                    ports = status.get("ports")
-                    status_info["ports"] = ",".join(str(p) for p in ports) if ports else "-"
-                    read_bytes = status.get("io_read_bytes")
-                    write_bytes = status.get("io_write_bytes")
-                    now = time.time()
-                    if isinstance(read_bytes, int) and isinstance(write_bytes, int):
-                        total = read_bytes + write_bytes
-                        if last_io_total is not None and last_io_time is not None:
-                            delta_bytes = max(0, total - last_io_total)
-                            delta_time = max(0.001, now - last_io_time)
-                            rate = delta_bytes / delta_time
-                            status_info["io_rate"] = f"{_format_bytes(int(rate))}/s"
-                            io_history.append(min(100.0, rate / (1024 * 1024) * 10))
-                        last_io_total = total
-                        last_io_time = now
-                    status_info["io_history"] = list(io_history)
-                    if isinstance(cpu, (int, float)):
-                        cpu_history.append(float(cpu))
-                    if isinstance(mem, (int, float)):
-                        mem_history.append(float(mem))
-                    status_info["cpu_history"] = list(cpu_history)
-                    status_info["mem_history"] = list(mem_history)
-
-                current_status = status.get("status")
-                if last_status == "running" and current_status in {"exited", "killed"}:
-                    timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-                    api_lines.append(f"{timestamp} status changed: running -> {current_status}")
-                last_status = current_status
-
-            if status:
-                logs_text = _get_text(f"{base_url}/logs?lines={lines}", headers=headers)
-                app_lines.clear()
-                if logs_text is None:
-                    app_lines.append("[unable to fetch logs]")
-                elif logs_text.strip():
-                    app_lines.extend(logs_text.splitlines())
-                else:
-                    app_lines.append("[no logs yet]")
-            else:
-                app_lines.clear()
-                app_lines.append("[api server unavailable]")
-            time.sleep(poll)
-
-    def kill_term() -> None:
-        base_url = f"http://{host}:{port}"
-        headers = {"x-llm-shell-tui": "1"}
-        _post_json(f"{base_url}/kill?type=SIGTERM", headers=headers)
-
-    def kill_kill() -> None:
-        base_url = f"http://{host}:{port}"
-        headers = {"x-llm-shell-tui": "1"}
-        _post_json(f"{base_url}/kill?type=SIGKILL", headers=headers)
-
-    threading.Thread(target=poll_app_logs, daemon=True).start()
+    api = _ApiConnection(host, port)
+    # The kill keys get their own connection, so a keypress is not queued
+    # behind a poll that is waiting out its timeout on a slow server.
+    kill_api = _ApiConnection(host, port)
+
+    logs_etag: Optional[str] = None
+    interval = poll
+    failures = 0
+    stable_polls = 0
+    last_state: Optional[tuple] = None
+
+    def poll_app_logs() -> float:
+        # One poll of /tui_frame; returns the delay until the next one.
+        nonlocal last_status, last_io_total, last_io_time, logs_etag, interval, failures, stable_polls, last_state
+        query = urllib.parse.urlencode({"lines": lines, "logs_etag": logs_etag or ""})
+        frame = api.request_json("GET", f"/tui_frame?{query}&{TUI_CLIENT_PARAM}")
+        status = frame.get("status") if frame else None
+        if status:
+            cpu = status.get("cpu_percent")
+            mem = status.get("memory_mb")
+            ports = status.get("ports")
+            read_bytes = status.get("io_read_bytes")
+            write_bytes = status.get("io_write_bytes")
+            now = time.time()
+            io_rate = snapshot_ref[0].io_rate
+            if isinstance(read_bytes, int) and isinstance(write_bytes, int):
+                total = read_bytes + write_bytes
+                if last_io_total is not None and last_io_time is not None:
+                    delta_bytes = max(0, total - last_io_total)
+                    delta_time = max(0.001, now - last_io_time)
+                    rate = delta_bytes / delta_time
+                    io_rate = f"{_format_bytes(int(rate))}/s"
+                    io_history.append(min(100.0, rate / (1024 * 1024) * 10))
+                last_io_total = total
+                last_io_time = now
+            if isinstance(cpu, (int, float)):
+                cpu_history.append(float(cpu))
+            if isinstance(mem, (int, float)):
+                mem_history.append(float(mem))
+            # Built completely, then published with a single reference store.
+            snapshot = _StatusSnapshot(
+                status=status.get("status") or "-",
+                pid=status.get("process_pid") or "-",
+                command=status.get("command") or "-",
+                uptime=_format_duration(status.get("uptime_seconds")),
+                cpu=f"{cpu:.1f}%" if isinstance(cpu, (int, float)) else "-",
+                mem=f"{mem:.1f} MB" if isinstance(mem, (int, float)) else "-",
+                user=status.get("user") or "-",
+                threads=status.get("threads"),
+                open_files=status.get("open_files"),
+                connections=status.get("connections"),
+                children=status.get("children"),
+                env_count=status.get("env_count"),
+                ports=",".join(str(p) for p in ports) if ports else "-",
+                io_rate=io_rate,
+                cpu_history=tuple(cpu_history),
+                mem_history=tuple(mem_history),
+                io_history=tuple(io_history),
+            )
+            if snapshot != snapshot_ref[0]:
+                snapshot_ref[0] = snapshot
+                damage.mark(_STATUS_PANE)
+
+            current_status = status.get("status")
+            if last_status == "running" and current_status in {"exited", "killed"}:
+                api_lines.append(f"{_clock(now)} status changed: running -> {current_status}")
+                damage.mark(_API_PANE)
+            last_status = current_status
+
+        if status:
+            log_lines = frame.get("logs")
+            logs_etag = frame.get("logs_etag")
+            # None: unchanged since logs_etag. A new etag can still carry the
+            # same tail (e.g. only blank lines appended), so the pane is only
+            # touched when its lines really differ.
+            if log_lines is not None:
+                if not any(line.strip() for line in log_lines):
+                    log_lines = ["[no logs yet]"]
+                if _merge_tail(app_lines, log_lines):
+                    damage.mark(_APP_PANE)
+        elif list(app_lines) != ["[api server unavailable]"]:
+            logs_etag = None
+            app_lines.clear()
+            app_lines.append("[api server unavailable]")
+            damage.mark(_APP_PANE)
+
+        # A process that is not running produces no new output: back off
+        # while nothing changes and snap back to poll on any change. A
+        # running process that stays quiet eases off linearly instead, so
+        # its first new output or exit is still seen within a few seconds.
+        # An unreachable API server backs off more gently, so a restart is
+        # still picked up quickly.
+        state = (status.get("status"), status.get("process_pid")) if status else None
+        if state is None:
+            failures += 1
+            stable_polls = 0
+            interval = min(poll * _ERROR_BACKOFF ** failures, max(poll, _ERROR_POLL_MAX))
+        elif state == last_state and state[0] in _IDLE_STATES:
+            failures = 0
+            stable_polls = 0
+            interval = min(interval * 1.5, max(poll, _IDLE_POLL_MAX))
+        elif state == last_state and frame.get("logs") is None:
+            failures = 0
+            stable_polls += 1
+            interval = poll * min(1 + stable_polls * _STABLE_POLL_STEP, _STABLE_POLL_MAX)
+        else:
+            failures = 0
+            stable_polls = 0
+            interval = poll
+        last_state = state
+        return interval
+
+    # Kill requests reuse kill_api's warm connection, so a keypress costs one
+    # round trip with a path built once here.
+    kill_term = functools.partial(kill_api.request_json, "POST", f"/kill?type=SIGTERM&{TUI_CLIENT_PARAM}")
+    kill_kill = functools.partial(kill_api.request_json, "POST", f"/kill?type=SIGKILL&{TUI_CLIENT_PARAM}")
+
+    background = threading.Thread(
+        target=_run_background,
+        args=(
+            api_process.stdout if api_process else None,
+            api_lines,
+            stop_event,
+            poll_app_logs,
+            functools.partial(damage.mark, _API_PANE),
+        ),
+        daemon=True,
+    )
+    background.start()
 
     try:
-        curses.wrapper(_run_tui, api_lines, app_lines, status_info, status_lock, stop_event, kill_term, kill_kill)
+        curses.wrapper(_run_tui, api_lines, app_lines, snapshot_ref, stop_event, damage, kill_term, kill_kill)
     except KeyboardInterrupt:
         stop_event.set()
     finally:
         stop_event.set()
+        api.close()
+        kill_api.close()
         if api_process and api_process.poll() is None:
             api_process.terminate()
             try:
                 api_process.wait(timeout=3)
             except subprocess.TimeoutExpired:
                 api_process.kill()
+                api_process.wait()
+        # The background thread notices stop_event within _READ_WAIT, or
+        # once an in-flight poll times out. The pipe is closed only after it
+        # has exited, so it never reads from a closed descriptor.
+        background.join(timeout=3)
+        if api_process is not None and not background.is_alive():
+            api_process.stdout.close()
 
 
 if __name__ == "__main__":
@@ -96,3 +96,58 @@ def test_restart():
 
     time.sleep(0.2)
     client.post("/kill?type=SIGKILL")
+
+
+def test_status_fields_filter():
+    client.post("/kill?type=SIGKILL")
+    start_response = client.post(
+        "/start?format=json",
+        json={"command": _python_command("import time; time.sleep(5)")},
+    )
+    assert start_response.status_code == 201
+
+    response = client.get("/status?format=json&fields=status,process_pid")
+    assert response.status_code == 200
+    assert set(response.json()) == {"status", "process_pid"}
+
+    client.post("/kill?type=SIGKILL")
+
+
+def test_logs_not_modified():
+    client.post("/kill?type=SIGKILL")
+    start_response = client.post(
+        "/start?format=json",
+        json={"command": _python_command("import time; print('ready'); time.sleep(5)")},
+    )
+    assert start_response.status_code == 201
+
+    response = client.get("/logs?lines=10")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    cached = client.get("/logs?lines=10", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    other_tail = client.get("/logs?lines=5", headers={"If-None-Match": etag})
+    assert other_tail.status_code == 200
+
+    client.post("/kill?type=SIGKILL")
+
+
+def test_tui_frame():
+    client.post("/kill?type=SIGKILL")
+    start_response = client.post(
+        "/start?format=json",
+        json={"command": _python_command("import time; print('ready'); time.sleep(5)")},
+    )
+    assert start_response.status_code == 201
+
+    frame = client.get("/tui_frame?lines=10").json()
+    assert frame["status"]["status"] == "running"
+    assert frame["logs"] == ["ready"]
+
+    unchanged = client.get("/tui_frame", params={"lines": 10, "logs_etag": frame["logs_etag"]}).json()
+    assert unchanged["logs"] is None
+    assert unchanged["logs_etag"] == frame["logs_etag"]
+
+    client.post("/kill?type=SIGKILL")
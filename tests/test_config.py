@@ -0,0 +1,71 @@
+import pytest
+
+from src.config import Settings, load_settings
+
+
+@pytest.fixture
+def env_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ("HOST", "PORT", "LOG_DIR", "DEFAULT_RESTART_TIMEOUT", "ACCESS_LOG"):
+        monkeypatch.delenv(f"LLM_SHELL_{name}", raising=False)
+    return tmp_path
+
+
+def test_load_settings_defaults(env_dir):
+    assert load_settings() == Settings()
+
+
+def test_load_settings_env_overrides_env_file(env_dir, monkeypatch):
+    (env_dir / ".env").write_text("LLM_SHELL_PORT=9000\nLLM_SHELL_HOST=127.0.0.1\n")
+    monkeypatch.setenv("LLM_SHELL_PORT", "9100")
+
+    settings = load_settings()
+    assert settings.port == 9100
+    assert settings.host == "127.0.0.1"
+
+
+def test_load_settings_names_are_case_insensitive(env_dir, monkeypatch):
+    (env_dir / ".env").write_text("llm_shell_log_dir=/tmp/logs\n")
+    monkeypatch.setenv("llm_shell_default_restart_timeout", "30")
+
+    settings = load_settings()
+    assert settings.log_dir == "/tmp/logs"
+    assert settings.default_restart_timeout == 30
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("true", True), ("On", True), ("0", False), ("no", False)])
+def test_load_settings_parses_booleans(env_dir, monkeypatch, raw, expected):
+    monkeypatch.setenv("LLM_SHELL_ACCESS_LOG", raw)
+
+    assert load_settings().access_log is expected
+
+
+def test_load_settings_rejects_bad_values(env_dir, monkeypatch):
+    monkeypatch.setenv("LLM_SHELL_PORT", "eighty")
+    with pytest.raises(ValueError, match="LLM_SHELL_PORT must be an integer"):
+        load_settings()
+
+    monkeypatch.setenv("LLM_SHELL_PORT", "80")
+    monkeypatch.setenv("LLM_SHELL_ACCESS_LOG", "maybe")
+    with pytest.raises(ValueError, match="LLM_SHELL_ACCESS_LOG must be a boolean"):
+        load_settings()
+
+
+def test_load_settings_env_file_comments_and_quotes(env_dir):
+    (env_dir / ".env").write_text(
+        "# settings\n"
+        "LLM_SHELL_PORT=9000 # api port\n"
+        'LLM_SHELL_LOG_DIR="/var/log/x"  # dir\n'
+        "export LLM_SHELL_HOST='a#b' \n"
+    )
+
+    settings = load_settings()
+    assert settings.port == 9000
+    assert settings.log_dir == "/var/log/x"
+    assert settings.host == "a#b"
+
+
+def test_load_settings_keeps_mismatched_quotes(env_dir):
+    (env_dir / ".env").write_text("LLM_SHELL_LOG_DIR=\"logs'\n")
+
+    assert load_settings().log_dir == "\"logs'"
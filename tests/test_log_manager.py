@@ -1,4 +1,9 @@
 import json
+import os
+import resource
+import shlex
+import subprocess
+import sys
 import time
 from pathlib import Path
 
@@ -68,6 +73,41 @@ def test_read_logs_seconds(tmp_path):
     assert "old" not in result["content"]
 
 
+def test_read_logs_skips_corrupt_lines(tmp_path):
+    manager = LogManager(log_dir=str(tmp_path))
+    log_file = Path(manager.create_log_file())
+
+    with log_file.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps({"timestamp": "2026-02-16T03:00:00Z", "line": "first"}) + "\n")
+        handle.write("{not json\n")
+        handle.write(json.dumps({"timestamp": "2026-02-16T03:00:01Z", "line": "second"}) + "\n")
+
+    result = manager.read_logs(str(log_file))
+    assert result["lines_returned"] == 2
+    assert result["content"] == "first\nsecond"
+
+
+def test_iter_logs_matches_read_logs(tmp_path):
+    manager = LogManager(log_dir=str(tmp_path))
+    log_file = Path(manager.create_log_file())
+
+    # Enough entries to span several read blocks.
+    entries = [
+        {"timestamp": "2026-02-16T03:00:00Z", "line": f"line {i} " + "x" * 100}
+        for i in range(2000)
+    ]
+    _write_json_lines(log_file, entries)
+
+    for kwargs in ({}, {"lines": 10}, {"seconds": 5}):
+        streamed = "".join(manager.iter_logs(str(log_file), **kwargs))
+        assert streamed == manager.read_logs(str(log_file), **kwargs)["content"]
+
+    assert manager.tail_lines(str(log_file), 10) == manager.read_logs(str(log_file), lines=10)["content"].split("\n")
+
+    with pytest.raises(BadRequestError):
+        manager.iter_logs(str(log_file), lines=1, seconds=1)
+
+
 def test_read_logs_invalid_parameters(tmp_path):
     manager = LogManager(log_dir=str(tmp_path))
     log_file = Path(manager.create_log_file())
@@ -81,3 +121,74 @@ def test_read_logs_missing_file(tmp_path):
 
     with pytest.raises(NotFoundError):
         manager.read_logs(str(tmp_path / "missing.log"))
+
+
+def test_log_writer_captures_process_output(tmp_path):
+    manager = LogManager(log_dir=str(tmp_path))
+    log_file = manager.create_log_file()
+
+    python = shlex.quote(sys.executable)
+    process = subprocess.Popen(
+        f"{python} -u -c \"[print('line', i) for i in range(1000)]\"",
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    manager.start_logging(process, log_file)
+    process.wait(timeout=5)
+    manager._writer_thread.join(timeout=5)
+
+    result = manager.read_logs(log_file, lines=1)
+    assert result["total_lines"] == 1000
+    assert result["content"] == "line 999"
+
+
+def test_log_writer_splits_carriage_returns(tmp_path):
+    manager = LogManager(log_dir=str(tmp_path))
+    log_file = manager.create_log_file()
+
+    python = shlex.quote(sys.executable)
+    code = r"import sys; sys.stdout.write('a\r\nprogress 1\rprogress 2\rdone\n')"
+    process = subprocess.Popen(
+        f"{python} -u -c \"{code}\"",
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    manager.start_logging(process, log_file)
+    process.wait(timeout=5)
+    manager._writer_thread.join(timeout=5)
+
+    result = manager.read_logs(log_file)
+    assert result["total_lines"] == 4
+    assert result["content"] == "a\nprogress 1\nprogress 2\ndone"
+
+
+def test_log_writer_handles_high_fd_numbers(tmp_path):
+    manager = LogManager(log_dir=str(tmp_path))
+    log_file = manager.create_log_file()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY and hard < 1200:
+        pytest.skip("needs more than 1200 open files")
+    resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, 1200), hard))
+    held = [os.open(os.devnull, os.O_RDONLY) for _ in range(1100)]
+    try:
+        python = shlex.quote(sys.executable)
+        process = subprocess.Popen(
+            f"{python} -u -c \"print('high fd')\"",
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        assert process.stdout.fileno() >= 1024
+        manager.start_logging(process, log_file)
+        process.wait(timeout=5)
+        manager._writer_thread.join(timeout=5)
+    finally:
+        for fd in held:
+            os.close(fd)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    assert manager.read_logs(log_file)["content"] == "high fd"